@@ -5,12 +5,16 @@ import logging
 import requests
 import tempfile
 import json
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Security
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict
 
-# Import our project modules
+# Import our project modules. The heavy ones (torch, sentence-transformers, faiss, NLTK)
+# are only imported on first use, see src/model_cache.py and src/startup.py.
+from src import startup
 from src.file_handler import extract_text_from_pdf
 from src.text_cleaner import load_cleaning_patterns, clean_text_with_patterns, post_process_text
 from src.clause_chunker import chunk_text_into_clauses
@@ -21,7 +25,13 @@ from retriever import SemanticSearcher
 # --- Configuration & Setup ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    startup.on_app_startup()
+    yield
+
 app = FastAPI(
+    lifespan=lifespan,
     title="HackRx Intelligent Query-Retrieval System",
     description="API for processing documents and answering questions using RAG.",
     version="1.0.0"
@@ -87,6 +97,16 @@ def process_document_on_the_fly(doc_url: str) -> str:
         if tmp_file_path and os.path.exists(tmp_file_path):
             os.unlink(tmp_file_path)
 
+# --- Health Endpoints ---
+@app.get("/health")
+async def health() -> Dict[str, Any]:
+    return startup.get_status()
+
+@app.get("/ready")
+async def ready() -> JSONResponse:
+    status = startup.get_status()
+    return JSONResponse(content=status, status_code=200 if status["ready"] else 503)
+
 # --- API Endpoints ---
 @app.post("/api/v1/hackrx/run", response_model=HackRxResponse)
 async def run_submission(request: HackRxRequest, _=Security(verify_token)):
@@ -0,0 +1,24 @@
+# gunicorn.conf.py
+#
+# Picked up automatically by `gunicorn api:app` when started from the project root.
+# With STARTUP_MODE=preload the master loads the model and the read-only indexes once,
+# before forking, and every worker shares those pages copy-on-write instead of loading
+# its own copy. In the other modes each worker warms up on its own (see src/startup.py).
+
+import logging
+import os
+
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.getenv("STARTUP_MODE", "").strip().lower() == "preload"
+
+def on_starting(server):
+    if not preload_app:
+        return
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    from src import startup
+    startup.preload_before_fork()
+
+def post_fork(server, worker):
+    from src import startup
+    startup.reset_after_fork()
@@ -3,25 +3,30 @@
 import json
 import logging
 import os
-import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 import numpy.typing as npt
 
-# --- Configuration ---
-MODEL_NAME = 'all-mpnet-base-v2'
-CLAUSES_DIR = 'output_clauses'
-EMBEDDINGS_DIR = 'output_embeddings'
+from src.model_cache import CLAUSES_DIR, EMBEDDINGS_DIR, MODEL_NAME, get_model, get_preloaded_document, load_clauses, read_index
+
+if TYPE_CHECKING:
+    import faiss
+    from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
 class SemanticSearcher:
     def __init__(self, document_base_name: str) -> None:
         self.document_base_name = document_base_name
-        self.model: SentenceTransformer
+        self.model: "SentenceTransformer"
         self.clauses: List[Dict[str, str]] = []
-        self.index: Optional[faiss.Index] = None
+        self.index: Optional["faiss.Index"] = None
+
+        preloaded = get_preloaded_document(document_base_name)
+        if preloaded is not None:
+            self.model = get_model()
+            self.clauses, self.index = preloaded
+            return
 
         clauses_path = os.path.join(CLAUSES_DIR, f"{document_base_name}_clauses.json")
         index_path = os.path.join(EMBEDDINGS_DIR, f"{document_base_name}.index")
@@ -30,23 +35,21 @@ class SemanticSearcher:
             logger.error(f"Missing processed files for document '{document_base_name}'.")
             return
 
-        logger.info(f"Loading model '{MODEL_NAME}' for semantic search...")
-        self.model = SentenceTransformer(MODEL_NAME)
+        logger.info(f"Using model '{MODEL_NAME}' for semantic search...")
+        self.model = get_model()
         self.clauses = self._load_clauses(clauses_path)
         self.index = self._load_index(index_path)
 
     def _load_clauses(self, path: str) -> List[Dict[str, str]]:
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_clauses(path)
         except Exception as e:
             logger.error(f"Error loading clauses from {path}: {e}")
             return []
 
-    def _load_index(self, path: str) -> Optional[faiss.Index]:
+    def _load_index(self, path: str) -> Optional["faiss.Index"]:
         try:
-            # Pylance will warn about missing stubs, which is safe to ignore.
-            return faiss.read_index(path)
+            return read_index(path)
         except Exception as e:
             logger.error(f"Error loading FAISS index from {path}: {e}")
             return None
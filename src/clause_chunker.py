@@ -2,14 +2,31 @@
 
 import re
 import logging
-from typing import List, Dict
-import nltk
+import threading
+from typing import Callable, List, Dict, Optional
 
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    logging.info("Downloading 'punkt' tokenizer for NLTK...")
-    nltk.download('punkt', quiet=True)
+_sent_tokenize: Optional[Callable[[str], List[str]]] = None
+_nltk_lock = threading.Lock()
+
+def get_sentence_tokenizer() -> Callable[[str], List[str]]:
+    """
+    Imports NLTK and makes sure the 'punkt' tokenizer is available, on first use only.
+    """
+    global _sent_tokenize
+    if _sent_tokenize is None:
+        with _nltk_lock:
+            if _sent_tokenize is None:
+                import nltk
+                try:
+                    nltk.data.find('tokenizers/punkt')
+                except LookupError:
+                    logging.info("Downloading 'punkt' tokenizer for NLTK...")
+                    nltk.download('punkt', quiet=True)
+                _sent_tokenize = nltk.sent_tokenize
+    return _sent_tokenize
+
+def is_sentence_tokenizer_loaded() -> bool:
+    return _sent_tokenize is not None
 
 # ... (The rest of the file is the same and is functionally correct) ...
 def is_new_chunk_header(line: str) -> bool:
@@ -39,7 +56,7 @@ def chunk_text_into_clauses(text: str, source_filename: str) -> List[Dict[str, s
         if len(chunk['text']) < 350:
             final_clauses.append({"clause_id": chunk['id'], "text": chunk['text'].strip().replace('\n', ' '), "source": source_filename})
         else:
-            sentences: List[str] = nltk.sent_tokenize(chunk['text'])
+            sentences: List[str] = get_sentence_tokenizer()(chunk['text'])
             for i, sentence in enumerate(sentences):
                 cleaned_sentence = sentence.replace('\n', ' ').strip()
                 if len(cleaned_sentence) > 15:
@@ -2,12 +2,10 @@
 
 import logging
 import numpy as np
-import faiss
-from sentence_transformers import SentenceTransformer
 from typing import List, Dict
 import numpy.typing as npt
 
-MODEL_NAME = 'all-mpnet-base-v2'
+from src.model_cache import MODEL_NAME, get_model
 
 def generate_and_save_embeddings(clauses_data: List[Dict[str, str]], index_path: str) -> None:
     """
@@ -17,9 +15,13 @@ def generate_and_save_embeddings(clauses_data: List[Dict[str, str]], index_path:
         logging.warning("  - No clauses found to generate embeddings. Skipping.")
         return
 
+    # Imported here rather than at module level to keep startup fast, but outside the
+    # try block so that a missing or broken install fails loudly instead of being logged.
+    import faiss
+
     try:
-        logging.info(f"  - Loading sentence transformer model: '{MODEL_NAME}'")
-        model = SentenceTransformer(MODEL_NAME)
+        logging.info(f"  - Using sentence transformer model: '{MODEL_NAME}'")
+        model = get_model()
         
         texts = [clause['text'] for clause in clauses_data]
         
@@ -39,5 +41,9 @@ def generate_and_save_embeddings(clauses_data: List[Dict[str, str]], index_path:
         logging.info(f"  - Saving FAISS index to: {index_path}")
         faiss.write_index(index, index_path)
         
+    except ImportError:
+        # get_model() imports sentence-transformers (and torch) on first use; a broken
+        # install of those should fail loudly too, not be logged as an embedding error.
+        raise
     except Exception as e:
         logging.error(f"  - An error occurred during embedding generation: {e}")
\ No newline at end of file
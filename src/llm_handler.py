@@ -14,17 +14,26 @@ load_dotenv()
 API_KEY = os.getenv("OPENROUTER_API_KEY")
 SITE_URL = os.getenv("OPENROUTER_SITE_URL")
 
-# This check is still important. It will now fail if the variable is missing
-# either from the .env file (locally) or the Render dashboard (in production).
-if not API_KEY:
-    raise ValueError("CRITICAL: OPENROUTER_API_KEY is not set in the environment.")
-if not SITE_URL:
-    raise ValueError("CRITICAL: OPENROUTER_SITE_URL is not set in the environment.")
+def check_llm_config() -> None:
+    """
+    Fails if the variables are missing either from the .env file (locally) or the
+    Render dashboard (in production). Checked on first use rather than at import,
+    so the API can start and report readiness before any question is answered.
+    """
+    if not API_KEY:
+        raise ValueError("CRITICAL: OPENROUTER_API_KEY is not set in the environment.")
+    if not SITE_URL:
+        raise ValueError("CRITICAL: OPENROUTER_SITE_URL is not set in the environment.")
+
+def is_llm_configured() -> bool:
+    return bool(API_KEY and SITE_URL)
 
 def get_answer_from_llm(query: str, retrieved_clauses: List[Dict[str, str]]) -> str:
     """
     Generates a concise answer using the specified model via OpenRouter.
     """
+    check_llm_config()
+
     if not retrieved_clauses:
         return "Based on the document, there is not enough information to answer this question."
 
@@ -0,0 +1,163 @@
+# src/model_cache.py
+
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+# torch, sentence-transformers and faiss are imported on first use only, so that
+# importing the API (or a gunicorn master) stays fast when nothing needs them yet.
+if TYPE_CHECKING:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+
+MODEL_NAME = 'all-mpnet-base-v2'
+INPUT_DIR = 'input_docs'
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+CLAUSES_DIR = 'output_clauses'
+EMBEDDINGS_DIR = 'output_embeddings'
+
+logger = logging.getLogger(__name__)
+
+_model: Optional["SentenceTransformer"] = None
+_model_lock = threading.Lock()
+
+# Read-only (clauses, index, (clauses mtime, index mtime)) entries loaded by
+# preload_indexes(), keyed by document base name.
+_documents: Dict[str, Tuple[List[Dict[str, str]], "faiss.Index", Tuple[float, float]]] = {}
+_documents_lock = threading.Lock()
+
+
+def get_model() -> "SentenceTransformer":
+    """
+    Returns the process-wide sentence transformer, loading it on first use.
+    """
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import SentenceTransformer
+                logger.info(f"Loading sentence transformer model: '{MODEL_NAME}'")
+                _model = SentenceTransformer(MODEL_NAME)
+    return _model
+
+
+def is_model_loaded() -> bool:
+    return _model is not None
+
+
+def read_index(path: str) -> "faiss.Index":
+    """
+    Reads a FAISS index into memory. It is deliberately not memory-mapped: faiss.write_index
+    truncates and rewrites the file in place when main.py reprocesses a document, which
+    would crash every process still searching a mapping of it. Workers forked from a
+    preloaded master share the in-memory copy copy-on-write instead.
+    """
+    import faiss
+    return faiss.read_index(path)
+
+
+def load_clauses(path: str) -> List[Dict[str, str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _document_paths(document_base_name: str) -> Tuple[str, str]:
+    return (os.path.join(CLAUSES_DIR, f"{document_base_name}_clauses.json"),
+            os.path.join(EMBEDDINGS_DIR, f"{document_base_name}.index"))
+
+
+def _document_mtimes(document_base_name: str) -> Optional[Tuple[float, float]]:
+    try:
+        return tuple(os.path.getmtime(p) for p in _document_paths(document_base_name))  # type: ignore[return-value]
+    except OSError:
+        return None
+
+
+def _read_document(document_base_name: str) -> Tuple[List[Dict[str, str]], "faiss.Index", Tuple[float, float]]:
+    """
+    Reads a document's clauses and index as a pair, refusing a pair that does not belong
+    together. main.py writes the clauses first and the index only after embedding every
+    clause, so for a while the files on disk are a new clause list and an old index.
+    """
+    mtimes = _document_mtimes(document_base_name)
+    if mtimes is None:
+        raise FileNotFoundError(f"Processed files for '{document_base_name}' not found.")
+    clauses_path, index_path = _document_paths(document_base_name)
+    clauses = load_clauses(clauses_path)
+    index = read_index(index_path)
+    if mtimes[1] < mtimes[0] or index.ntotal != len(clauses):
+        raise ValueError(f"Processed files for '{document_base_name}' are inconsistent "
+                         f"({len(clauses)} clauses, {index.ntotal} vectors); main.py may still be writing them.")
+    return clauses, index, mtimes
+
+
+def _load_document(document_base_name: str) -> None:
+    entry = _read_document(document_base_name)
+    with _documents_lock:
+        _documents[document_base_name] = entry
+
+
+def get_preloaded_document(document_base_name: str) -> Optional[Tuple[List[Dict[str, str]], Any]]:
+    """
+    Returns the cached (clauses, index) pair for a preloaded document, reloading it first
+    if main.py has reprocessed the files since they were cached.
+    """
+    entry = _documents.get(document_base_name)
+    if entry is None:
+        return None
+
+    mtimes = _document_mtimes(document_base_name)
+    if mtimes is None:
+        with _documents_lock:
+            _documents.pop(document_base_name, None)
+        return None
+
+    if mtimes != entry[2]:
+        try:
+            _load_document(document_base_name)
+            logger.info(f"Reloaded '{document_base_name}' after it was reprocessed.")
+            entry = _documents[document_base_name]
+        except Exception as e:
+            # The cached entry is an in-memory copy, so it stays valid; it keeps its old
+            # mtimes, and the reload is tried again on the next request.
+            logger.warning(f"Not reloading '{document_base_name}' yet, serving the cached copy: {e}")
+    return entry[0], entry[1]
+
+
+def preloaded_document_names() -> List[str]:
+    return sorted(_documents)
+
+
+def queryable_document_names(input_dir: str = INPUT_DIR) -> List[str]:
+    """
+    Base names main.py gives the documents in input_docs/, i.e. the ones that can be
+    asked about through /api/v1/local/query. Per-upload files from /api/v1/hackrx/run
+    get a fresh random name each time and are never looked up again, so they are skipped.
+    """
+    if not os.path.isdir(input_dir):
+        return []
+    return sorted(os.path.splitext(f)[0] for f in os.listdir(input_dir)
+                  if f.lower().endswith(SUPPORTED_EXTENSIONS))
+
+
+def preload_indexes(input_dir: str = INPUT_DIR) -> int:
+    """
+    Loads the processed files of every queryable document into the read-only cache.
+    Returns the number of documents loaded.
+    """
+    loaded = 0
+    for base_name in queryable_document_names(input_dir):
+        if _document_mtimes(base_name) is None:
+            logger.warning(f"Skipping preload of '{base_name}': processed files not found. Run main.py first.")
+            continue
+        try:
+            _load_document(base_name)
+        except Exception as e:
+            logger.error(f"Error preloading document '{base_name}': {e}")
+            continue
+        loaded += 1
+
+    logger.info(f"Preloaded {loaded} read-only document index(es) for '{input_dir}'.")
+    return loaded
@@ -0,0 +1,211 @@
+# src/startup.py
+
+import gc
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from src.clause_chunker import get_sentence_tokenizer, is_sentence_tokenizer_loaded
+from src.llm_handler import is_llm_configured
+from src.model_cache import get_model, is_model_loaded, preload_indexes, preloaded_document_names
+
+# Startup modes, selected with the STARTUP_MODE environment variable:
+#   lazy       - load nothing up front; the model and NLTK are loaded by the first request.
+#   background - each worker starts serving at once and warms up in a background thread (default).
+#   preload    - the gunicorn master loads the model and read-only indexes before forking,
+#                so workers share those pages copy-on-write (see gunicorn.conf.py).
+STARTUP_MODES = ('lazy', 'background', 'preload')
+DEFAULT_STARTUP_MODE = 'background'
+
+# Delays between background warm-up attempts after a failure, e.g. a failed model download.
+WARM_UP_RETRY_DELAYS = (5, 15, 30, 60)
+
+# Taken when this module is first imported, which is as early as the app gets.
+_process_start = time.perf_counter()
+
+logger = logging.getLogger(__name__)
+
+_state: Dict[str, Any] = {
+    "warming": False,
+    "error": None,
+    "preloaded_in_master": False,
+    "timings": {},
+}
+_state_lock = threading.Lock()
+
+
+def get_startup_mode() -> str:
+    mode = os.getenv("STARTUP_MODE", DEFAULT_STARTUP_MODE).strip().lower()
+    if mode not in STARTUP_MODES:
+        logger.warning(f"Unknown STARTUP_MODE '{mode}'. Falling back to '{DEFAULT_STARTUP_MODE}'.")
+        return DEFAULT_STARTUP_MODE
+    return mode
+
+
+def _record_timing(name: str, started: float) -> None:
+    _state["timings"][name] = round(time.perf_counter() - started, 3)
+
+
+def is_warm() -> bool:
+    """
+    Worked out from what is actually loaded, so a worker whose warm-up failed still
+    becomes warm once a request has loaded the model and tokenizer itself.
+    """
+    return is_model_loaded() and is_sentence_tokenizer_loaded()
+
+
+def warm_up() -> bool:
+    """
+    Loads the sentence transformer, the read-only document indexes and the NLTK tokenizer.
+    Safe to call more than once; returns whether the process is warm afterwards.
+    """
+    with _state_lock:
+        if is_warm() or _state["warming"]:
+            return is_warm()
+        _state["warming"] = True
+
+    try:
+        started = time.perf_counter()
+        get_model()
+        _record_timing("model_load_seconds", started)
+
+        started = time.perf_counter()
+        preload_indexes()
+        _record_timing("index_load_seconds", started)
+
+        started = time.perf_counter()
+        get_sentence_tokenizer()
+        _record_timing("nltk_load_seconds", started)
+
+        _state["error"] = None
+        _state["timings"]["ready_after_seconds"] = round(time.perf_counter() - _process_start, 3)
+        logger.info(f"Warm-up complete in pid {os.getpid()}: {_state['timings']}")
+        return True
+    except Exception as e:
+        _state["error"] = str(e)
+        logger.error(f"Warm-up failed: {e}", exc_info=True)
+        return False
+    finally:
+        _state["warming"] = False
+
+
+def _warm_up_with_retries() -> None:
+    """Keeps retrying, since a worker that never warms up is never sent traffic either."""
+    if warm_up():
+        return
+    for delay in itertools.chain(WARM_UP_RETRY_DELAYS, itertools.repeat(WARM_UP_RETRY_DELAYS[-1])):
+        time.sleep(delay)
+        if is_warm() or warm_up():
+            return
+
+
+def preload_before_fork() -> None:
+    """
+    Warms up in the gunicorn master, then moves every object created so far into the
+    permanent GC generation so the collector does not dirty the pages workers share.
+    """
+    if warm_up():
+        _state["preloaded_in_master"] = True
+        gc.freeze()
+    log_memory_usage("master after preload")
+
+
+def start_background_warm_up() -> Optional[threading.Thread]:
+    if is_warm():
+        return None
+    thread = threading.Thread(target=_warm_up_with_retries, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def reset_after_fork() -> None:
+    """Restarts the uptime clock in a freshly forked worker."""
+    global _process_start
+    _process_start = time.perf_counter()
+
+
+def on_app_startup() -> None:
+    """
+    Called once per worker when the app starts serving. A worker forked from a preloaded
+    master is already warm; otherwise it warms up in the background unless the mode is lazy.
+    """
+    if is_warm():
+        _state["timings"]["worker_ready_after_seconds"] = round(time.perf_counter() - _process_start, 3)
+    elif get_startup_mode() != 'lazy':
+        start_background_warm_up()
+    log_memory_usage("worker started")
+
+
+def is_ready() -> bool:
+    """In lazy mode the worker is ready as soon as it serves; otherwise once warm."""
+    return is_warm() or get_startup_mode() == 'lazy'
+
+
+def _read_proc_memory() -> Dict[str, int]:
+    """Reads Rss, Pss and shared/private page totals (in KiB) from /proc on Linux."""
+    wanted = {"Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty"}
+    usage: Dict[str, int] = {}
+    try:
+        with open('/proc/self/smaps_rollup', 'r', encoding='utf-8') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in wanted:
+                    usage[key] = int(value.split()[0])
+    except (OSError, ValueError):
+        pass
+    return usage
+
+
+def get_memory_usage() -> Dict[str, float]:
+    """
+    Returns this process's memory usage in MiB. Pss divides shared pages between the
+    processes mapping them, so it is the figure to compare across forked workers.
+    """
+    usage = _read_proc_memory()
+    if usage:
+        shared = usage.get("Shared_Clean", 0) + usage.get("Shared_Dirty", 0)
+        private = usage.get("Private_Clean", 0) + usage.get("Private_Dirty", 0)
+        return {
+            "rss_mb": round(usage.get("Rss", 0) / 1024, 1),
+            "pss_mb": round(usage.get("Pss", 0) / 1024, 1),
+            "shared_mb": round(shared / 1024, 1),
+            "private_mb": round(private / 1024, 1),
+        }
+
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+        divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        return {"max_rss_mb": round(peak / divisor, 1)}
+    except ImportError:
+        return {}
+
+
+def log_memory_usage(label: str) -> None:
+    logger.info(f"Memory usage ({label}, pid {os.getpid()}): {get_memory_usage()}")
+
+
+def get_status() -> Dict[str, Any]:
+    warm = is_warm()
+    if warm:
+        # A request may have finished loading what a failed warm-up could not.
+        _state["error"] = None
+    return {
+        "pid": os.getpid(),
+        "startup_mode": get_startup_mode(),
+        "warm": warm,
+        "warming": _state["warming"],
+        "ready": is_ready(),
+        "error": _state["error"],
+        "preloaded_in_master": _state["preloaded_in_master"],
+        "preloaded_documents": preloaded_document_names(),
+        "llm_configured": is_llm_configured(),
+        "uptime_seconds": round(time.perf_counter() - _process_start, 3),
+        "timings": dict(_state["timings"]),
+        "memory": get_memory_usage(),
+    }
@@ -0,0 +1,16 @@
+# tests/conftest.py
+
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+@pytest.fixture
+def repo_root(monkeypatch: pytest.MonkeyPatch) -> str:
+    # The app resolves config/, input_docs/ and output_*/ relative to the working directory.
+    monkeypatch.chdir(ROOT_DIR)
+    return ROOT_DIR
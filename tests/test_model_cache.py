@@ -0,0 +1,84 @@
+# tests/test_model_cache.py
+
+import json
+import os
+from typing import List
+
+import numpy as np
+import pytest
+
+from src import model_cache
+
+faiss = pytest.importorskip("faiss")
+
+
+def _write_document(tmp_path, base_name: str, texts: List[str]) -> None:
+    with open(tmp_path / "output_clauses" / f"{base_name}_clauses.json", 'w', encoding='utf-8') as f:
+        json.dump([{"clause_id": str(i), "text": t, "source": f"{base_name}.pdf"} for i, t in enumerate(texts)], f)
+    index = faiss.IndexFlatL2(4)
+    index.add(np.random.rand(len(texts), 4).astype('float32'))
+    faiss.write_index(index, str(tmp_path / "output_embeddings" / f"{base_name}.index"))
+
+
+@pytest.fixture
+def doc_dirs(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    for name in ("input_docs", "output_clauses", "output_embeddings"):
+        (tmp_path / name).mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(model_cache, "_documents", {})
+    return tmp_path
+
+
+def test_preload_only_loads_documents_from_input_docs(doc_dirs) -> None:
+    (doc_dirs / "input_docs" / "Policy.pdf").write_bytes(b"")
+    _write_document(doc_dirs, "Policy", ["a", "b"])
+    _write_document(doc_dirs, "tmpabc123", ["leftover from /hackrx/run"])
+
+    assert model_cache.preload_indexes() == 1
+    assert model_cache.preloaded_document_names() == ["Policy"]
+    assert model_cache.get_preloaded_document("tmpabc123") is None
+
+
+def test_preloaded_document_is_reloaded_after_reprocessing(doc_dirs) -> None:
+    (doc_dirs / "input_docs" / "Policy.pdf").write_bytes(b"")
+    _write_document(doc_dirs, "Policy", ["a", "b"])
+    model_cache.preload_indexes()
+    clauses, index = model_cache.get_preloaded_document("Policy")
+    assert len(clauses) == 2 and index.ntotal == 2
+
+    _write_document(doc_dirs, "Policy", ["a", "b", "c"])
+    index_path = doc_dirs / "output_embeddings" / "Policy.index"
+    mtime = os.path.getmtime(index_path) + 10
+    os.utime(index_path, (mtime, mtime))
+
+    clauses, index = model_cache.get_preloaded_document("Policy")
+    assert len(clauses) == 3 and index.ntotal == 3
+
+
+def test_reload_is_refused_until_the_index_matches_the_clauses(doc_dirs) -> None:
+    (doc_dirs / "input_docs" / "Policy.pdf").write_bytes(b"")
+    _write_document(doc_dirs, "Policy", ["a", "b"])
+    model_cache.preload_indexes()
+
+    # main.py has written the new clauses but is still embedding them.
+    clauses_path = doc_dirs / "output_clauses" / "Policy_clauses.json"
+    with open(clauses_path, 'w', encoding='utf-8') as f:
+        json.dump([{"clause_id": str(i), "text": t, "source": "Policy.pdf"} for i, t in enumerate("abc")], f)
+    mtime = os.path.getmtime(clauses_path) + 10
+    os.utime(clauses_path, (mtime, mtime))
+
+    clauses, index = model_cache.get_preloaded_document("Policy")
+    assert len(clauses) == 2 and index.ntotal == 2
+
+
+def test_rewriting_a_preloaded_index_leaves_the_cached_copy_searchable(doc_dirs) -> None:
+    (doc_dirs / "input_docs" / "Policy.pdf").write_bytes(b"")
+    _write_document(doc_dirs, "Policy", [str(i) for i in range(500)])
+    model_cache.preload_indexes()
+    _clauses, old_index = model_cache.get_preloaded_document("Policy")
+
+    # faiss.write_index truncates and rewrites the same file in place.
+    _write_document(doc_dirs, "Policy", ["a"])
+
+    _distances, ids = old_index.search(np.zeros((1, 4), dtype='float32'), 3)
+    assert all(0 <= i < 500 for i in ids[0])
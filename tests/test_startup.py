@@ -0,0 +1,128 @@
+# tests/test_startup.py
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+from src import startup
+
+HEAVY_MODULES = ['torch', 'sentence_transformers', 'faiss', 'nltk']
+
+
+def test_importing_api_defers_heavy_modules(repo_root: str) -> None:
+    pytest.importorskip("fastapi")
+    env = dict(os.environ, OPENROUTER_API_KEY="", OPENROUTER_SITE_URL="")
+    code = f"import json, sys, api; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=repo_root, env=env,
+                            capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+@pytest.fixture
+def loaded(monkeypatch: pytest.MonkeyPatch) -> Dict[str, bool]:
+    """Stands in for the model and tokenizer loaders, tracking what is 'loaded'."""
+    state = {"model": False, "tokenizer": False, "fail_model": False}
+
+    def fake_get_model() -> None:
+        if state["fail_model"]:
+            raise OSError("model download failed")
+        state["model"] = True
+
+    def fake_get_sentence_tokenizer() -> None:
+        state["tokenizer"] = True
+
+    monkeypatch.setattr(startup, "get_model", fake_get_model)
+    monkeypatch.setattr(startup, "get_sentence_tokenizer", fake_get_sentence_tokenizer)
+    monkeypatch.setattr(startup, "is_model_loaded", lambda: state["model"])
+    monkeypatch.setattr(startup, "is_sentence_tokenizer_loaded", lambda: state["tokenizer"])
+    monkeypatch.setattr(startup, "preload_indexes", lambda: 0)
+    monkeypatch.setattr(startup, "is_llm_configured", lambda: False)
+    monkeypatch.setattr(startup, "_state", {"warming": False, "error": None,
+                                            "preloaded_in_master": False, "timings": {}})
+    return state
+
+
+def _ready_status_code() -> int:
+    pytest.importorskip("fastapi")
+    import api
+    return asyncio.run(api.ready()).status_code
+
+
+@pytest.mark.parametrize("mode", ["lazy", "background", "preload", "bogus"])
+def test_cold_worker_readiness_depends_on_mode(repo_root: str, loaded: Dict[str, bool],
+                                               monkeypatch: pytest.MonkeyPatch, mode: str) -> None:
+    monkeypatch.setenv("STARTUP_MODE", mode)
+    status = startup.get_status()
+
+    assert status["warm"] is False
+    assert status["startup_mode"] == ("background" if mode == "bogus" else mode)
+    assert status["llm_configured"] is False
+    assert status["ready"] is (mode == "lazy")
+    assert _ready_status_code() == (200 if mode == "lazy" else 503)
+
+
+def test_warm_up_makes_worker_ready(repo_root: str, loaded: Dict[str, bool],
+                                    monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("STARTUP_MODE", "background")
+    assert startup.warm_up() is True
+
+    status = startup.get_status()
+    assert status["warm"] is True and status["ready"] is True
+    assert {"model_load_seconds", "nltk_load_seconds", "ready_after_seconds"} <= set(status["timings"])
+    assert _ready_status_code() == 200
+
+
+def test_failed_warm_up_recovers_once_a_request_loads_the_model(repo_root: str, loaded: Dict[str, bool],
+                                                                monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("STARTUP_MODE", "background")
+    loaded["fail_model"] = True
+    assert startup.warm_up() is False
+
+    status = startup.get_status()
+    assert status["ready"] is False
+    assert status["error"] == "model download failed"
+    assert _ready_status_code() == 503
+
+    # A later request loads the model and tokenizer through the normal code paths.
+    loaded["model"] = loaded["tokenizer"] = True
+    status = startup.get_status()
+    assert status["ready"] is True
+    assert status["error"] is None
+    assert _ready_status_code() == 200
+
+
+def test_background_warm_up_retries_after_failure(loaded: Dict[str, bool],
+                                                  monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts = []
+
+    def flaky_get_model() -> None:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("model download failed")
+        loaded["model"] = True
+
+    monkeypatch.setattr(startup, "get_model", flaky_get_model)
+    monkeypatch.setattr(startup, "WARM_UP_RETRY_DELAYS", (0,))
+    thread = startup.start_background_warm_up()
+    assert thread is not None
+    thread.join(timeout=5)
+
+    assert len(attempts) == 2
+    assert startup.is_warm()
+    assert startup.get_status()["error"] is None
+
+
+def test_preload_before_fork_marks_workers_as_preloaded(loaded: Dict[str, bool],
+                                                        monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("STARTUP_MODE", "preload")
+    monkeypatch.setattr(startup.gc, "freeze", lambda: None)
+    startup.preload_before_fork()
+
+    status = startup.get_status()
+    assert status["preloaded_in_master"] is True
+    assert status["ready"] is True